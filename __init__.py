@@ -1,11 +1,96 @@
 import bpy
 import os
+import queue
+import threading
 import time
-import subprocess
-import platform
+
+try:
+    from . import _watcher
+except ImportError:
+    import _watcher
 
 linked_files = {}
-DEVNULL = open(os.devnull, 'wb')
+file_watcher = None
+
+# Background scan machinery for the polling fallback: a worker thread does
+# the stat pass (which may block on slow network mounts) and pushes changed
+# paths here; the timer drains the queue and calls lib.reload() on the main
+# thread, which is the only place Blender data may be touched
+_change_queue = queue.Queue()
+_state_lock = threading.Lock()
+_scan_thread = None
+_scan_stop = None
+_scan_interval = 1.0
+
+# Exponential backoff while nothing changes: every 5 quiet passes the wait
+# doubles (up to 16x the base interval, capped at 30s), and the first
+# detected change snaps back to the base interval. Disabled in aggressive
+# mode, where constant low latency is the point.
+_scan_adaptive = True
+_no_change_streak = 0
+
+# Hot/cold polling: a file that changed within the last _HOT_TICKS passes
+# is stat-ed every pass, everything else only when a cold poll is due.
+# Cold polls are scheduled on wall-clock time against the base interval
+# (not pass count), so the idle backoff stretches the hot cadence without
+# also multiplying into the cold one. With dozens of tracked files and
+# one or two under active edit, this cuts the average stats per pass by
+# roughly 10x.
+_HOT_TICKS = 5
+_COLD_POLL_EVERY = 10
+_tick_counter = 0
+_next_cold_poll_ts = 0.0
+
+# Changed files are batched and reloaded together once writes have gone
+# quiet, so a multi-file save doesn't trigger a reload per tick
+_RELOAD_QUIET_PERIOD = 0.1
+_pending_reloads = set()
+_last_change_ts = 0.0
+_reload_lock = threading.Lock()
+# Reused by flush_pending_reloads instead of allocating a list per flush
+_updated_names = []
+
+# (id(lib), lib.filepath) -> absolute path, so the //-relative expansion
+# isn't redone for every library on every poll
+_abspath_cache = {}
+
+# Files that failed to stat, with the time of the failure: a library on an
+# unmounted volume would otherwise raise (and pay for) an exception on
+# every single pass. Missing files are retried after a cooldown.
+_MISSING_RETRY = 5.0
+_missing_paths = {}
+
+# Identity of the library set the last time it was resolved, plus the
+# resolved path -> library mapping, so an unchanged set skips re-resolution
+_last_lib_ids = frozenset()
+_path_to_lib = {}
+
+# The panel's row labels, rebuilt only when the tracked set is replaced;
+# Blender may redraw the sidebar dozens of times per second
+_lib_gen = 0
+_display_cache = []
+_display_cache_gen = -1
+
+# Monitoring state mirrored into plain module globals, kept in sync by the
+# toggle operator and property update callbacks, so the timer tick doesn't
+# traverse window_manager RNA properties just to learn nothing changed
+_monitoring = False
+_cached_interval = 1.0
+_cached_aggressive = True
+_last_check_time = 0.0
+
+def _on_interval_update(self, context):
+    # Keep the cached copies live while the user drags the slider
+    global _cached_interval, _scan_interval
+    _cached_interval = self.check_interval
+    if not _cached_aggressive:
+        _scan_interval = self.check_interval
+
+def _on_watch_mode_update(self, context):
+    global _cached_aggressive, _scan_interval, _scan_adaptive
+    _cached_aggressive = self.watch_mode == 'AGGRESSIVE'
+    _scan_interval = 0.2 if _cached_aggressive else self.check_interval
+    _scan_adaptive = not _cached_aggressive
 
 class LinkedFileProperties(bpy.types.PropertyGroup):
     check_interval: bpy.props.FloatProperty(
@@ -13,16 +98,14 @@ class LinkedFileProperties(bpy.types.PropertyGroup):
         description="Time interval for checking linked files",
         default=1.0,
         min=0.1,
-        max=60.0
+        max=60.0,
+        update=_on_interval_update
     )
     is_monitoring: bpy.props.BoolProperty(
         name="Monitoring Active",
         description="Status of linked file monitoring",
         default=False
     )
-    last_check_time: bpy.props.FloatProperty(
-        default=0.0
-    )
     watch_mode: bpy.props.EnumProperty(
         name="Watch Mode",
         description="Method to use for file monitoring",
@@ -30,69 +113,220 @@ class LinkedFileProperties(bpy.types.PropertyGroup):
             ('DIRECT', "Direct", "Monitor files directly (default)"),
             ('AGGRESSIVE', "Aggressive", "Force filesystem refresh (slower but more reliable)"),
         ],
-        default='AGGRESSIVE'
+        default='AGGRESSIVE',
+        update=_on_watch_mode_update
     )
 
+class _LibState:
+    """Per-library tracking state; slots keep entries small and lookups fast."""
+    __slots__ = ('library', 'mtime_ns', 'size', 'lib_name', 'last_change_tick')
+
+    def __init__(self, library, mtime_ns, size, lib_name):
+        self.library = library
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.lib_name = lib_name
+        # Treat fresh entries as just-changed so they poll hot from the start
+        self.last_change_tick = _tick_counter
+
 def force_filesystem_update(filepath):
-    """Force the filesystem to update by calling external commands."""
-    if not os.path.exists(filepath):
-        return False
-    
+    """Force the filesystem to refresh its cached attributes for a file."""
     try:
-        # Different approaches based on OS
-        system = platform.system().lower()
-        
-        if system == 'windows':
-            # Windows: use dir command to refresh
-            subprocess.call(['dir', '/b', filepath], shell=True, stdout=DEVNULL, stderr=DEVNULL)
-        elif system in ['darwin', 'linux']:
-            # macOS/Linux: use ls
-            subprocess.call(['ls', '-la', filepath], stdout=DEVNULL, stderr=DEVNULL)
-            
-        # Force read a small portion of the file
-        with open(filepath, 'rb') as f:
-            f.seek(0)
-            f.read(1024)  # Read first 1KB
-            
+        # Opening a fresh fd makes the kernel re-fetch the file's attributes
+        # (important for stale attribute caches on network mounts)
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                # Drop any cached pages so the next read hits the filesystem
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
         return True
-    except:
+    except OSError:
         return False
 
-def get_direct_file_info(filepath):
-    """Get file info directly via stat."""
-    try:
-        stat = os.stat(filepath)
-        return {
-            "mtime": stat.st_mtime,
-            "size": stat.st_size
-        }
-    except:
-        return None
+def _stat_paths(filepaths):
+    """Stats the given files, batching via scandir per shared parent directory.
+
+    Pure filesystem work - safe to call from the scan thread. Returns a dict
+    of filepath -> stat result; missing files are simply absent. Paths are
+    expected to be fully resolved (realpath), so stats don't need to chase
+    symlinks again.
+    """
+    results = {}
+    now = time.time()
+
+    # Group by parent directory, skipping files known to be missing until
+    # their retry cooldown has elapsed
+    by_dir = {}
+    for filepath in filepaths:
+        if now - _missing_paths.get(filepath, 0) < _MISSING_RETRY:
+            continue
+        by_dir.setdefault(os.path.dirname(filepath), {})[os.path.basename(filepath)] = filepath
+
+    for directory, wanted in by_dir.items():
+        if len(wanted) == 1:
+            # Lone file: a plain stat is cheaper than reading the directory.
+            # Single stat gives existence, mtime and size in one syscall
+            (filepath,) = wanted.values()
+            try:
+                results[filepath] = os.lstat(filepath)
+            except OSError:
+                _missing_paths[filepath] = now
+                continue
+            _missing_paths.pop(filepath, None)
+        else:
+            # Several libraries share this directory: one scandir amortizes
+            # the path walk over all of them (one round-trip on network mounts)
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        filepath = wanted.get(entry.name)
+                        if filepath is None:
+                            continue
+                        try:
+                            results[filepath] = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            _missing_paths[filepath] = now
+                            continue
+                        _missing_paths.pop(filepath, None)
+            except OSError:
+                # Whole directory is gone (e.g. unmounted volume)
+                for filepath in wanted.values():
+                    _missing_paths[filepath] = now
+                continue
+
+    return results
+
+def _library_set_changed():
+    """Cheap check whether the set of libraries differs from the last resolve."""
+    libs = bpy.data.libraries
+    if len(libs) == 0:
+        return len(_last_lib_ids) != 0
+    return frozenset(id(lib) for lib in libs) != _last_lib_ids
 
 def get_linked_files():
     """Finds all linked files in the scene and records their last modified times."""
+    global _last_lib_ids, _path_to_lib
     linked_files_data = {}
-    
-    for lib in bpy.data.libraries:
-        if lib.filepath:
-            # Get absolute path
-            filepath = bpy.path.abspath(lib.filepath)
-            if os.path.exists(filepath):
-                # Force filesystem to recognize changes
-                force_filesystem_update(filepath)
-                
-                # Get file info
-                file_info = get_direct_file_info(filepath)
-                if file_info:
-                    linked_files_data[filepath] = {
-                        "library": lib,
-                        "last_modified": file_info["mtime"],
-                        "size": file_info["size"],
-                        "lib_name": lib.name
-                    }
-    
+
+    libs = bpy.data.libraries
+    if len(libs) == 0:
+        _last_lib_ids = frozenset()
+        _path_to_lib = {}
+        return linked_files_data
+
+    lib_ids = frozenset(id(lib) for lib in libs)
+    if lib_ids == _last_lib_ids:
+        # Same libraries as last time: reuse the resolved paths
+        path_to_lib = _path_to_lib
+    else:
+        # Resolve paths (cached - recomputing them every poll is wasted work).
+        # realpath chases any symlinks once here, so the stat passes can use
+        # lstat / follow_symlinks=False and skip the resolution per syscall
+        path_to_lib = {}
+        for lib in libs:
+            if lib.filepath:
+                key = (id(lib), lib.filepath)
+                filepath = _abspath_cache.get(key)
+                if filepath is None:
+                    filepath = _abspath_cache.setdefault(
+                        key, os.path.realpath(bpy.path.abspath(lib.filepath)))
+                path_to_lib[filepath] = lib
+        _last_lib_ids = lib_ids
+        _path_to_lib = path_to_lib
+
+    stats = _stat_paths(path_to_lib)
+    for filepath, lib in path_to_lib.items():
+        st = stats.get(filepath)
+        if st is not None:
+            linked_files_data[filepath] = _LibState(
+                lib, st.st_mtime_ns, st.st_size,
+                lib.name or os.path.basename(filepath))
+        else:
+            # Currently missing (e.g. unmounted volume): keep it tracked
+            # with sentinel values so the scan passes retry it after the
+            # cooldown and the first successful stat reads as a change
+            linked_files_data[filepath] = _LibState(
+                lib, 0, -1,
+                lib.name or os.path.basename(filepath))
+
     return linked_files_data
 
+def scan_for_changes():
+    """Stat pass run on the scan thread - compares and flags, never touches bpy.
+
+    Returns True if any change was detected.
+    """
+    global _tick_counter, _next_cold_poll_ts
+    _tick_counter += 1
+    tick = _tick_counter
+    poll_cold = time.time() >= _next_cold_poll_ts
+    if poll_cold:
+        _next_cold_poll_ts = time.time() + _COLD_POLL_EVERY * _scan_interval
+
+    changed = False
+    with _state_lock:
+        # Cold files (no recent changes) are only included when due
+        snapshot = {fp: (data.mtime_ns, data.size)
+                    for fp, data in linked_files.items()
+                    if poll_cold or tick - data.last_change_tick <= _HOT_TICKS}
+
+    for filepath, st in _stat_paths(snapshot).items():
+        mtime_ns, size = snapshot[filepath]
+        if st.st_mtime_ns != mtime_ns or st.st_size != size:
+            with _state_lock:
+                data = linked_files.get(filepath)
+                if data is None:
+                    continue
+                data.mtime_ns = st.st_mtime_ns
+                data.size = st.st_size
+                data.last_change_tick = tick
+            _change_queue.put(filepath)
+            changed = True
+
+    return changed
+
+def _scan_wait_interval():
+    if not _scan_adaptive:
+        return _scan_interval
+    return min(_scan_interval * (2 ** min(_no_change_streak // 5, 4)), 30.0)
+
+def _scan_loop(stop_event):
+    global _no_change_streak
+    # Event.wait is an interruptible sleep, so stopping takes effect immediately
+    while not stop_event.wait(_scan_wait_interval()):
+        if scan_for_changes():
+            _no_change_streak = 0
+        else:
+            _no_change_streak += 1
+
+def start_scan_thread():
+    global _scan_thread, _scan_stop
+    stop_scan_thread()
+    _scan_stop = threading.Event()
+    _scan_thread = threading.Thread(
+        target=_scan_loop, args=(_scan_stop,),
+        name="linked_file_scan", daemon=True)
+    _scan_thread.start()
+
+def stop_scan_thread():
+    global _scan_thread, _scan_stop
+    if _scan_stop is not None:
+        _scan_stop.set()
+    _scan_thread = None
+    _scan_stop = None
+
+def start_scan_session():
+    """Configures and starts the polling scan thread for this session."""
+    global _scan_interval, _scan_adaptive, _no_change_streak, _next_cold_poll_ts
+    _scan_interval = 0.2 if _cached_aggressive else _cached_interval
+    _scan_adaptive = not _cached_aggressive
+    _no_change_streak = 0
+    _next_cold_poll_ts = 0.0
+    start_scan_thread()
+
 def update_linked_files():
     """Updates linked files when changes are detected."""
     global linked_files
@@ -107,92 +341,188 @@ def update_linked_files():
             old_info = linked_files[filepath]
             
             # Check if file changed (time or size)
-            if (data["last_modified"] > old_info["last_modified"] or 
-                data["size"] != old_info["size"]):
+            if (data.mtime_ns != old_info.mtime_ns or
+                data.size != old_info.size):
                 
-                lib_name = data["lib_name"]
-                print(f"Change detected in {lib_name}. Last modified: {time.ctime(data['last_modified'])}")
-                print(f"  Old time: {time.ctime(old_info['last_modified'])}, New time: {time.ctime(data['last_modified'])}")
-                print(f"  Old size: {old_info['size']}, New size: {data['size']}")
+                lib_name = data.lib_name
+                print(f"Change detected in {lib_name}. Last modified: {time.ctime(data.mtime_ns / 1e9)}")
+                print(f"  Old time: {time.ctime(old_info.mtime_ns / 1e9)}, New time: {time.ctime(data.mtime_ns / 1e9)}")
+                print(f"  Old size: {old_info.size}, New size: {data.size}")
                 
                 try:
                     # Force reload the library
                     if props.watch_mode == 'AGGRESSIVE':
                         force_filesystem_update(filepath)
-                    data["library"].reload()
+                    data.library.reload()
                     updated_files.append(lib_name)
                 except Exception as e:
                     print(f"Error updating {lib_name}: {str(e)}")
-    
+
     # Update our cache
-    linked_files = current_linked_files
-    
+    global _lib_gen
+    with _state_lock:
+        linked_files = current_linked_files
+    _lib_gen += 1
+
     return updated_files
 
-def poll_files():
-    """Alternative polling method for aggressive mode."""
-    props = bpy.context.window_manager.linked_file_updater
-    updated = []
-    
-    if props.watch_mode == 'AGGRESSIVE':
-        # Get fresh list with filesystem refresh
-        global linked_files
-        for filepath in linked_files:
-            force_filesystem_update(filepath)
-        
-        fresh_files = get_linked_files()
-        
-        # Check for updates
-        for filepath, data in fresh_files.items():
-            if filepath in linked_files:
-                old_info = linked_files[filepath]
-                
-                # Check for changes
-                if (data["last_modified"] > old_info["last_modified"] or 
-                    data["size"] != old_info["size"]):
-                    
-                    try:
-                        print(f"Direct poll: change in {data['lib_name']}")
-                        data["library"].reload()
-                        updated.append(data["lib_name"])
-                    except:
-                        pass
-        
-        # Update our cache
-        linked_files = fresh_files
-    
-    return updated
+def refresh_linked_files():
+    """Re-syncs the tracked set with bpy.data.libraries (new/removed links)."""
+    global linked_files, _lib_gen
+
+    # Unchanged set: nothing to do, the scan thread already watches these
+    if not _library_set_changed():
+        return
+
+    fresh = get_linked_files()
+    with _state_lock:
+        for filepath, data in fresh.items():
+            old = linked_files.get(filepath)
+            if old is not None:
+                # Keep the observed state so a write landing between scan
+                # thread passes is still detected, and the hot/cold tick
+                # so a refresh doesn't demote actively edited files
+                data.mtime_ns = old.mtime_ns
+                data.size = old.size
+                data.last_change_tick = old.last_change_tick
+        linked_files = fresh
+    _lib_gen += 1
+
+def process_change_queue():
+    """Stages changes flagged by the scan thread for a coalesced reload."""
+    global _last_change_ts
+
+    while True:
+        try:
+            filepath = _change_queue.get_nowait()
+        except queue.Empty:
+            break
+        _pending_reloads.add(filepath)
+        _last_change_ts = time.time()
+
+def handle_watcher_events():
+    """Stages changes flagged by the kernel file watcher."""
+    global _last_change_ts
+
+    for filepath in file_watcher.poll():
+        data = linked_files.get(filepath)
+        if not data:
+            continue
+        try:
+            st = os.stat(filepath)
+            data.mtime_ns = st.st_mtime_ns
+            data.size = st.st_size
+        except OSError:
+            pass
+        _pending_reloads.add(filepath)
+        _last_change_ts = time.time()
+
+def flush_pending_reloads():
+    """Reloads the batched changes once writes have gone quiet.
+
+    A multi-file save (.blend plus textures) touches several libraries
+    within milliseconds; waiting out a short quiet period reloads them in
+    one pass instead of blocking the UI once per file.
+
+    Returns None on the no-work ticks so the steady state allocates nothing;
+    the returned name list is a reused module-level buffer.
+    """
+    if not _pending_reloads:
+        return None
+    if time.time() - _last_change_ts < _RELOAD_QUIET_PERIOD:
+        return None
+    # Only one reload pass at a time
+    if not _reload_lock.acquire(blocking=False):
+        return None
+
+    try:
+        updated = _updated_names
+        updated.clear()
+        for filepath in sorted(_pending_reloads):
+            with _state_lock:
+                data = linked_files.get(filepath)
+            if not data:
+                continue
+            lib_name = data.lib_name
+            print(f"Change detected in {lib_name}. Last modified: {time.ctime(data.mtime_ns / 1e9)}")
+            try:
+                if _cached_aggressive:
+                    force_filesystem_update(filepath)
+                data.library.reload()
+                updated.append(lib_name)
+            except Exception as e:
+                print(f"Error updating {lib_name}: {str(e)}")
+        _pending_reloads.clear()
+        return updated if updated else None
+    finally:
+        _reload_lock.release()
+
+def tag_panel_redraw():
+    """Flags the 3D viewports for redraw so the panel reflects new state."""
+    screen = bpy.context.screen
+    if screen is None:
+        return
+    for area in screen.areas:
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
 
 def check_linked_files():
-    """Timer function - checks linked files at specified intervals."""
-    props = bpy.context.window_manager.linked_file_updater
-    
+    """Timer function - reads only module globals, no RNA traversal per tick."""
+    global _last_check_time, file_watcher
+
     # Stop if monitoring is off
-    if not props.is_monitoring:
-        return props.check_interval
-    
+    if not _monitoring:
+        return _cached_interval
+
     current_time = time.time()
-    updated_files = []
-    
-    # Normal interval based check
-    if current_time - props.last_check_time >= props.check_interval:
-        props.last_check_time = current_time
-        updated_files = update_linked_files()
-    
-    # Always do direct polling in aggressive mode
-    elif props.watch_mode == 'AGGRESSIVE':
-        poll_updated = poll_files()
-        if poll_updated:
-            updated_files.extend(poll_updated)
-    
+    effective_interval = 0.2 if _cached_aggressive else _cached_interval
+
+    # Event-driven path: just drain the kernel notification fd
+    if file_watcher is not None:
+        handle_watcher_events()
+        updated_files = flush_pending_reloads()
+        # Libraries linked after monitoring started still need watches
+        if current_time - _last_check_time >= effective_interval:
+            _last_check_time = current_time
+            known_paths = set(linked_files)
+            refresh_linked_files()
+            for filepath in linked_files:
+                if filepath in known_paths:
+                    continue
+                # Mirror create_watcher: a path the watcher can't cover
+                # (network mount, or a watch that fails and would never
+                # be retried) demotes the whole session to polling
+                demote = _watcher.is_network_path(filepath)
+                if not demote:
+                    try:
+                        file_watcher.watch(filepath)
+                    except OSError:
+                        demote = True
+                if demote:
+                    file_watcher.close()
+                    file_watcher = None
+                    start_scan_session()
+                    break
+        if updated_files is not None:
+            print(f"Updated: {', '.join(updated_files)}")
+            tag_panel_redraw()
+        return 0.05 if file_watcher is not None else 0.1
+
+    # The scan thread does the stat work off the main thread; here we only
+    # reload what it flagged and keep the tracked set in sync with the scene
+    process_change_queue()
+    updated_files = flush_pending_reloads()
+
+    if current_time - _last_check_time >= effective_interval:
+        _last_check_time = current_time
+        refresh_linked_files()
+
     # Handle updates
-    if updated_files:
-        message = f"Updated: {', '.join(updated_files)}"
-        print(message)
-        bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
-    
-    # Always check rapidly in aggressive mode, otherwise use the interval
-    return 0.2 if props.watch_mode == 'AGGRESSIVE' else props.check_interval
+    if updated_files is not None:
+        print(f"Updated: {', '.join(updated_files)}")
+        tag_panel_redraw()
+
+    return 0.1
 
 class VIEW3D_PT_linked_file_updater(bpy.types.Panel):
     """Linked File Sync Updater Panel"""
@@ -239,12 +569,16 @@ class VIEW3D_PT_linked_file_updater(bpy.types.Panel):
         box = layout.box()
         box.label(text="Linked Files:")
         
-        if not linked_files:
+        global _display_cache, _display_cache_gen
+        if _display_cache_gen != _lib_gen:
+            _display_cache = [data.lib_name for data in linked_files.values()]
+            _display_cache_gen = _lib_gen
+
+        if not _display_cache:
             box.label(text="No linked files found.")
         else:
-            for filepath, data in linked_files.items():
+            for lib_name in _display_cache:
                 row = box.row()
-                lib_name = data.get("lib_name", os.path.basename(filepath))
                 row.label(text=lib_name)
 
 class LINKED_FILE_OT_toggle_monitoring(bpy.types.Operator):
@@ -255,15 +589,43 @@ class LINKED_FILE_OT_toggle_monitoring(bpy.types.Operator):
     def execute(self, context):
         props = context.window_manager.linked_file_updater
         props.is_monitoring = not props.is_monitoring
-        
+
+        global linked_files, file_watcher, _lib_gen
+        global _monitoring, _cached_interval, _cached_aggressive, _last_check_time
+        _monitoring = props.is_monitoring
+        _cached_interval = props.check_interval
+        _cached_aggressive = props.watch_mode == 'AGGRESSIVE'
+        if file_watcher is not None:
+            file_watcher.close()
+            file_watcher = None
+        stop_scan_thread()
+
         if props.is_monitoring:
-            global linked_files
-            linked_files = get_linked_files()
-            props.last_check_time = time.time()
-            self.report({'INFO'}, "Linked file monitoring started.")
+            global _last_lib_ids, _path_to_lib
+            _abspath_cache.clear()
+            _missing_paths.clear()
+            _last_lib_ids = frozenset()
+            _path_to_lib = {}
+            # Drop findings from a previous session
+            _pending_reloads.clear()
+            while not _change_queue.empty():
+                try:
+                    _change_queue.get_nowait()
+                except queue.Empty:
+                    break
+            with _state_lock:
+                linked_files = get_linked_files()
+            _lib_gen += 1
+            _last_check_time = time.time()
+            file_watcher = _watcher.create_watcher(list(linked_files.keys()))
+            if file_watcher is not None:
+                self.report({'INFO'}, "Linked file monitoring started (event-driven).")
+            else:
+                start_scan_session()
+                self.report({'INFO'}, "Linked file monitoring started (polling).")
         else:
             self.report({'INFO'}, "Linked file monitoring stopped.")
-            
+
         return {'FINISHED'}
 
 class LINKED_FILE_OT_force_check(bpy.types.Operator):
@@ -295,18 +657,22 @@ class LINKED_FILE_OT_manual_update(bpy.types.Operator):
     
     def execute(self, context):
         global linked_files
-        
+
         # Get fresh list
-        linked_files = get_linked_files()
-        
+        global _lib_gen
+        fresh_files = get_linked_files()
+        with _state_lock:
+            linked_files = fresh_files
+        _lib_gen += 1
+
         # Update all
         updated = 0
         for filepath, data in linked_files.items():
             try:
-                data["library"].reload()
+                data.library.reload()
                 updated += 1
             except Exception as e:
-                print(f"Error updating {data.get('lib_name', os.path.basename(filepath))}: {str(e)}")
+                print(f"Error updating {data.lib_name}: {str(e)}")
         
         self.report({'INFO'}, f"Reloaded {updated} linked files.")
         return {'FINISHED'}
@@ -332,11 +698,20 @@ def register():
 def unregister():
     if bpy.app.timers.is_registered(check_linked_files):
         bpy.app.timers.unregister(check_linked_files)
-    
-    global DEVNULL
-    if DEVNULL:
-        DEVNULL.close()
-    
+
+    global file_watcher, _monitoring
+    _monitoring = False
+    if file_watcher is not None:
+        file_watcher.close()
+        file_watcher = None
+    stop_scan_thread()
+
+    global _last_lib_ids, _path_to_lib
+    _abspath_cache.clear()
+    _missing_paths.clear()
+    _last_lib_ids = frozenset()
+    _path_to_lib = {}
+
     if hasattr(bpy.types.WindowManager, "linked_file_updater"):
         del bpy.types.WindowManager.linked_file_updater
     
@@ -0,0 +1,173 @@
+"""Kernel file-change notifications for linked library monitoring.
+
+Uses inotify on Linux so that idle monitoring costs no CPU at all; the
+timer only drains a non-blocking fd instead of stat-ing every library.
+Directories are watched (not the files themselves) and events are
+filtered to the tracked basenames, so unrelated activity in big asset
+folders stays cheap.
+
+On platforms without inotify, or when a tracked file lives on a network
+mount (where inotify does not see remote writes), create_watcher returns
+None and the caller falls back to the stat-polling loop.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import re
+import struct
+import sys
+
+# inotify event masks (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = 0x00000800
+
+# Filesystem types where inotify can't see writes from other machines
+NETWORK_FS_TYPES = {
+    'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'sshfs',
+    'fuse.sshfs', '9p', 'afs', 'ncpfs', 'glusterfs',
+}
+
+_libc = None
+
+
+def _get_libc():
+    global _libc
+    if _libc is None:
+        name = ctypes.util.find_library('c') or 'libc.so.6'
+        _libc = ctypes.CDLL(name, use_errno=True)
+    return _libc
+
+
+def supported():
+    """Return True if inotify is available on this platform."""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        return hasattr(_get_libc(), 'inotify_init1')
+    except OSError:
+        return False
+
+
+_OCTAL_ESCAPE = re.compile(r'\\([0-7]{3})')
+
+
+def _unescape_mount_path(field):
+    """Decodes the octal escapes (\\040 etc.) /proc/mounts uses for spaces."""
+    if '\\' not in field:
+        return field
+    return _OCTAL_ESCAPE.sub(lambda m: chr(int(m.group(1), 8)), field)
+
+
+def is_network_path(path):
+    """Check whether a path lives on a network-mounted filesystem."""
+    try:
+        with open('/proc/mounts', 'r') as f:
+            mounts = f.readlines()
+    except OSError:
+        return False
+
+    best_fstype = None
+    best_len = -1
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        mountpoint, fstype = _unescape_mount_path(fields[1]), fields[2]
+        # Match on whole path components: /mnt/data must not claim
+        # /mnt/database/x.blend
+        if (mountpoint == '/' or path == mountpoint
+                or path.startswith(mountpoint + '/')):
+            if len(mountpoint) > best_len:
+                best_len = len(mountpoint)
+                best_fstype = fstype
+
+    return best_fstype in NETWORK_FS_TYPES
+
+
+class InotifyWatcher:
+    """Watches the parent directories of tracked files via inotify."""
+
+    def __init__(self):
+        libc = _get_libc()
+        self._libc = libc
+        self._fd = libc.inotify_init1(IN_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # wd -> directory, (wd, basename) -> tracked filepath
+        self._dirs = {}
+        self._tracked = {}
+
+    def watch(self, filepath):
+        """Track a file by watching its parent directory."""
+        directory = os.path.dirname(filepath) or '.'
+        wd = None
+        for known_wd, known_dir in self._dirs.items():
+            if known_dir == directory:
+                wd = known_wd
+                break
+        if wd is None:
+            wd = self._libc.inotify_add_watch(
+                self._fd, directory.encode('utf-8'),
+                IN_CLOSE_WRITE | IN_MOVED_TO)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(),
+                              f"inotify_add_watch failed for {directory}")
+            self._dirs[wd] = directory
+        self._tracked[(wd, os.path.basename(filepath))] = filepath
+
+    def poll(self):
+        """Drain pending events; return the set of changed tracked files."""
+        changed = set()
+        while True:
+            try:
+                buf = os.read(self._fd, 4096)
+            except BlockingIOError:
+                break
+            except OSError:
+                break
+            offset = 0
+            while offset + 16 <= len(buf):
+                wd, mask, cookie, name_len = struct.unpack_from('iIII', buf, offset)
+                name = buf[offset + 16:offset + 16 + name_len].split(b'\0')[0]
+                offset += 16 + name_len
+                filepath = self._tracked.get((wd, os.fsdecode(name)))
+                if filepath:
+                    changed.add(filepath)
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = -1
+        self._dirs.clear()
+        self._tracked.clear()
+
+
+def create_watcher(filepaths):
+    """Build a watcher for the given files, or None to use stat polling.
+
+    Returns None when inotify is unavailable, there is nothing to watch
+    yet, or any tracked file sits on a network mount (remote writes don't
+    generate local inotify events).
+    """
+    if not filepaths:
+        return None
+    if not supported():
+        return None
+    for filepath in filepaths:
+        if is_network_path(filepath):
+            return None
+
+    watcher = InotifyWatcher()
+    try:
+        for filepath in filepaths:
+            watcher.watch(filepath)
+    except OSError:
+        watcher.close()
+        return None
+    return watcher